@@ -8,27 +8,374 @@ Architecture: Pure JS panel (registered via registerComponent in JS)
 + Python operators (for backend computation). No Python Panel class.
 """
 
-import uuid
+import os
+import secrets
 import json
+import hashlib
 import time
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypedDict
 
 import fiftyone as fo
 import fiftyone.operators as foo
 import fiftyone.operators.types as types
 
 from .executor import GraphExecutor
-from .nodes import get_node_registry
+from .nodes import (
+    LABEL_FQNS, PATCHES_FQNS, DETECTION_FQNS,
+    CLASSIFICATION_FQNS, SEGMENTATION_FQNS, REGRESSION_FQNS,
+    VECTOR_FQNS, LABEL_PATH_MAP, get_field_fqn, get_field_type_fqn,
+    get_node_registry,
+)
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional speedup for execute_graph decoding
+    msgspec = None
+
+try:
+    import zstandard
+except ImportError:  # optional, only needed for compressed graph storage
+    zstandard = None
 
 logger = logging.getLogger(__name__)
 
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps(obj):
+    """Encode ``obj`` as JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
 STORE_VERSION = "v1"
 SHARED_STORE_KEY = f"fiftycomfy_shared_{STORE_VERSION}"
 
+# Cached GetDatasetInfo payload, stored alongside the dataset's graphs
+DATASET_INFO_KEY = "dataset_info"
+DATASET_INFO_TTL = 300  # seconds
+
+# In-process front for the stored dataset info, so that repeat panel opens
+# skip the schema read and store round-trip entirely
+_INFO_CACHE = OrderedDict()
+_INFO_CACHE_SIZE = 32
+_info_cache_lock = threading.Lock()
+
+# Issue GetDatasetInfo's independent queries concurrently (set to "0" to
+# run them serially, e.g. when debugging database access)
+PARALLEL_META = os.environ.get("FIFTYCOMFY_PARALLEL_META", "1") != "0"
+
+# Reject serialized graphs above this size before decoding them
+MAX_GRAPH_BYTES = int(
+    os.environ.get("FIFTYCOMFY_MAX_GRAPH_BYTES", str(32 * 1024 * 1024))
+)
+
+# Store saved graph bodies zstd-compressed (set to "1" to enable). Opt-in
+# because every process that loads such graphs then needs zstandard;
+# compressed and plain entries can be read side by side.
+COMPRESS_GRAPHS = os.environ.get("FIFTYCOMFY_COMPRESS_GRAPHS", "0") == "1"
+
 
 def _get_store_key(ctx):
-    dataset_id = str(ctx.dataset._doc.id) if ctx.dataset else "none"
-    return f"fiftycomfy_{dataset_id}_{STORE_VERSION}"
+    dataset = ctx.dataset
+    if not dataset:
+        return f"fiftycomfy_none_{STORE_VERSION}"
+
+    # Memoize on the dataset instance (a dataset's id never changes)
+    key = getattr(dataset, "_fiftycomfy_store_key", None)
+    if key is None:
+        key = f"fiftycomfy_{dataset._doc.id}_{STORE_VERSION}"
+        try:
+            dataset._fiftycomfy_store_key = key
+        except Exception:
+            pass
+
+    return key
+
+
+def _dataset_info_signature(dataset, schema, include_label_classes):
+    """Fingerprint the dataset state that GetDatasetInfo depends on."""
+    raw = (
+        repr(sorted(schema.items()))
+        + str(dataset.last_modified_at)
+        + str(include_label_classes)
+    )
+    return hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()
+
+
+def _get_cached_info(key, last_modified_at):
+    """Return a cached payload if the dataset is unchanged, else None."""
+    with _info_cache_lock:
+        hit = _INFO_CACHE.get(key)
+        if hit is None:
+            return None
+
+        modified_at, expires_at, payload = hit
+        if modified_at != last_modified_at or time.monotonic_ns() > expires_at:
+            del _INFO_CACHE[key]
+            return None
+
+        _INFO_CACHE.move_to_end(key)
+        return payload
+
+
+def _cache_info(key, last_modified_at, payload):
+    expires_at = time.monotonic_ns() + DATASET_INFO_TTL * 1_000_000_000
+    with _info_cache_lock:
+        _INFO_CACHE[key] = (last_modified_at, expires_at, payload)
+        _INFO_CACHE.move_to_end(key)
+        while len(_INFO_CACHE) > _INFO_CACHE_SIZE:
+            _INFO_CACHE.popitem(last=False)
+
+
+def _invalidate_info(store_key):
+    """Drop all in-process dataset info cached for a store key."""
+    with _info_cache_lock:
+        for key in [k for k in _INFO_CACHE if k[0] == store_key]:
+            del _INFO_CACHE[key]
+
+
+def _run_queries(queries):
+    """Run independent dataset queries, concurrently when enabled.
+
+    ``queries`` maps a result key to a ``(fn, default)`` pair. A query that
+    raises resolves to its default, matching the best-effort semantics of
+    the dataset info payload.
+    """
+
+    def _run(fn, default):
+        try:
+            return fn()
+        except Exception:
+            return default
+
+    if not PARALLEL_META or len(queries) < 2:
+        return {key: _run(fn, default) for key, (fn, default) in queries.items()}
+
+    with ThreadPoolExecutor(max_workers=min(8, len(queries))) as pool:
+        futures = {
+            key: pool.submit(_run, fn, default)
+            for key, (fn, default) in queries.items()
+        }
+        return {key: future.result() for key, future in futures.items()}
+
+
+def _distinct_many(dataset, paths):
+    """Return distinct values for several fields in one aggregation pass.
+
+    FiftyOne fuses a list of aggregations into a single pipeline. Since one
+    bad path fails the whole batch, fall back to per-field queries (None on
+    failure) in that case.
+    """
+    if not paths:
+        return []
+
+    try:
+        return dataset.aggregate([fo.Distinct(path) for path in paths])
+    except Exception:
+        results = []
+        for path in paths:
+            try:
+                results.append(dataset.distinct(path))
+            except Exception:
+                results.append(None)
+        return results
+
+
+def _check_graph_size(graph_json):
+    """Raise ValueError if a serialized graph exceeds MAX_GRAPH_BYTES."""
+    size = len(graph_json)
+    logger.debug(f"[FiftyComfy] Graph payload size: {size}")
+    if size > MAX_GRAPH_BYTES:
+        raise ValueError(
+            f"graph is too large ({size} > {MAX_GRAPH_BYTES} bytes)"
+        )
+
+
+def _parse_graph(graph_json):
+    """Decode the serialized LiteGraph JSON sent by the panel.
+
+    Accepts a ``str``/``bytes`` payload or an already-decoded dict.
+    """
+    if type(graph_json) is dict:
+        return graph_json
+    if isinstance(graph_json, (str, bytes)):
+        _check_graph_size(graph_json)
+        return _loads(graph_json)
+    return graph_json
+
+
+class _NodeSpec(TypedDict, total=False):
+    """The parts of a serialized LiteGraph node that GraphExecutor reads."""
+
+    id: int | str
+    type: str
+    properties: dict
+    widgets_values: list | dict
+
+
+class _GraphSpec(TypedDict, total=False):
+    """The parts of a serialized LiteGraph graph that GraphExecutor reads."""
+
+    nodes: list[_NodeSpec]
+    links: list[list]
+
+
+_execution_decoder = (
+    msgspec.json.Decoder(_GraphSpec) if msgspec is not None else None
+)
+
+
+def _parse_execution_graph(graph_json):
+    """Decode a graph for execution, keeping only the fields it needs.
+
+    Node positions, sizes, slot metadata, etc. are never materialized.
+    Payloads that don't match the schema (e.g., from a newer LiteGraph
+    serialization format) fall back to the generic decoder.
+    """
+    if type(graph_json) is dict:
+        return graph_json
+    if _execution_decoder is not None and isinstance(graph_json, (str, bytes)):
+        _check_graph_size(graph_json)
+        try:
+            return _execution_decoder.decode(graph_json)
+        except msgspec.ValidationError:
+            pass
+    return _parse_graph(graph_json)
+
+
+# ─── Graph store helpers ────────────────────────────────────────────
+# Each saved graph lives under ``graph_{id}`` with a small index entry
+# under ``graph_idx_{id}``, so saves and deletes never read-modify-write
+# a shared index document that grows with the library.
+
+GRAPH_INDEX_PREFIX = "graph_idx_"
+LEGACY_INDEX_KEY = "graph_index"
+
+
+def _migrate_legacy_index(store):
+    """Split a pre-existing ``graph_index`` list into per-graph keys."""
+    legacy = store.get(LEGACY_INDEX_KEY)
+    if legacy is None:
+        return
+
+    for meta in legacy:
+        store.set(f"{GRAPH_INDEX_PREFIX}{meta['id']}", meta)
+    store.delete(LEGACY_INDEX_KEY)
+
+
+def _save_graph_entry(store, name, graph_data):
+    """Persist a graph and its index entry, returning the new graph id."""
+    graph_id = secrets.token_hex(8)
+    saved_at = time.time_ns()
+
+    entry = {"id": graph_id, "name": name, "saved_at": saved_at}
+    if COMPRESS_GRAPHS and zstandard is not None:
+        # Compressors aren't thread-safe, and are cheap to create
+        entry["graph_zstd"] = zstandard.ZstdCompressor(level=3).compress(
+            _dumps(graph_data)
+        )
+    else:
+        entry["graph"] = graph_data
+
+    # Write the body before its index entry so that a listed graph is
+    # always loadable, and roll the body back if indexing fails
+    store.set(f"graph_{graph_id}", entry)
+    try:
+        store.set(f"{GRAPH_INDEX_PREFIX}{graph_id}", {
+            "id": graph_id,
+            "name": name,
+            "saved_at": saved_at,
+        })
+    except Exception:
+        store.delete(f"graph_{graph_id}")
+        raise
+
+    return graph_id
+
+
+def _load_graph_entry(store, graph_id):
+    """Return a saved graph with its body decoded, or None if missing."""
+    return _decode_graph_entry(store.get(f"graph_{graph_id}"))
+
+
+def _decode_graph_entry(entry):
+    """Decompress a stored graph entry's body if it was saved compressed."""
+    if not entry or "graph_zstd" not in entry:
+        return entry
+
+    if zstandard is None:
+        raise ValueError(
+            "This graph was saved compressed; install 'zstandard' to load it"
+        )
+
+    entry = dict(entry)
+    body = zstandard.ZstdDecompressor().decompress(entry.pop("graph_zstd"))
+    entry["graph"] = _loads(body)
+    return entry
+
+
+def _list_graph_entries(store):
+    """Return the index entries of all saved graphs, oldest first."""
+    _migrate_legacy_index(store)
+
+    index = []
+    for key in store.list_keys():
+        if key.startswith(GRAPH_INDEX_PREFIX):
+            meta = store.get(key)
+            if meta:
+                index.append(meta)
+
+    # Older entries store saved_at in float seconds; those values are far
+    # smaller than any nanosecond timestamp, so they still sort first
+    index.sort(key=lambda meta: meta["saved_at"])
+    return index
+
+
+def _list_graphs_response(ctx, store):
+    """Build the load_graphs result, optionally with graph bodies.
+
+    Pass ``graph_ids`` (or ``include_payloads=True`` for every listed
+    graph) to receive the bodies under ``payloads`` in the same call,
+    instead of one load_graph round-trip per graph.
+    """
+    index = _list_graph_entries(store)
+    result = {"graphs": index}
+
+    graph_ids = ctx.params.get("graph_ids")
+    if graph_ids is None and ctx.params.get("include_payloads", False):
+        graph_ids = [meta["id"] for meta in index]
+    if not graph_ids:
+        return result
+
+    payloads = {}
+    for graph_id in graph_ids:
+        try:
+            entry = _load_graph_entry(store, graph_id)
+        except Exception as e:
+            logger.warning(f"[FiftyComfy] Could not load graph {graph_id}: {e}")
+            continue
+        if entry:
+            payloads[graph_id] = entry
+
+    result["payloads"] = payloads
+    return result
+
+
+def _delete_graph_entry(store, graph_id):
+    """Remove a saved graph and its index entry."""
+    _migrate_legacy_index(store)
+    store.delete(f"graph_{graph_id}")
+    store.delete(f"{GRAPH_INDEX_PREFIX}{graph_id}")
 
 
 # ─── Execute Graph Operator ─────────────────────────────────────────
@@ -47,7 +394,7 @@ class ExecuteGraph(foo.Operator):
     def execute(self, ctx):
         graph_json = ctx.params.get("graph_json", "")
         try:
-            graph_data = json.loads(graph_json) if isinstance(graph_json, str) else graph_json
+            graph_data = _parse_execution_graph(graph_json)
         except Exception as e:
             yield ctx.ops.notify(f"Invalid graph JSON: {e}", variant="error")
             return
@@ -55,9 +402,16 @@ class ExecuteGraph(foo.Operator):
         registry = get_node_registry()
         executor = GraphExecutor(registry)
 
-        # Forward all generator yields from the executor
-        for msg in executor.execute(ctx, graph_data):
-            yield msg
+        # Forward all generator yields from the executor as they are
+        # produced, so the App sees progress per node rather than at the end
+        yield from executor.execute(ctx, graph_data)
+
+        # Workflows can add fields, brain runs, evaluations and saved views,
+        # so drop the cached dataset info to force a fresh read
+        if ctx.dataset:
+            store_key = _get_store_key(ctx)
+            _invalidate_info(store_key)
+            ctx.store(store_key).delete(DATASET_INFO_KEY)
 
 
 # ─── Save Graph Operator ────────────────────────────────────────────
@@ -77,24 +431,11 @@ class SaveGraph(foo.Operator):
         graph_json = ctx.params.get("graph_json", "")
 
         try:
-            graph_data = json.loads(graph_json) if isinstance(graph_json, str) else graph_json
+            graph_data = _parse_graph(graph_json)
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
-        graph_id = str(uuid.uuid4())
-        entry = {
-            "id": graph_id,
-            "name": name,
-            "graph": graph_data,
-            "saved_at": time.time(),
-        }
-
-        store.set(f"graph_{graph_id}", entry)
-
-        index = store.get("graph_index") or []
-        index.append({"id": graph_id, "name": name, "saved_at": entry["saved_at"]})
-        store.set("graph_index", index)
-
+        graph_id = _save_graph_entry(store, name, graph_data)
         return {"status": "ok", "graph_id": graph_id}
 
 
@@ -111,8 +452,7 @@ class LoadGraphs(foo.Operator):
 
     def execute(self, ctx):
         store = ctx.store(_get_store_key(ctx))
-        index = store.get("graph_index") or []
-        return {"graphs": index}
+        return _list_graphs_response(ctx, store)
 
 
 # ─── Load Single Graph Operator ─────────────────────────────────────
@@ -129,7 +469,10 @@ class LoadGraph(foo.Operator):
     def execute(self, ctx):
         store = ctx.store(_get_store_key(ctx))
         graph_id = ctx.params.get("graph_id")
-        entry = store.get(f"graph_{graph_id}")
+        try:
+            entry = _load_graph_entry(store, graph_id)
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
         if not entry:
             return {"status": "error", "error": f"Graph {graph_id} not found"}
         return {"status": "ok", "data": entry}
@@ -149,12 +492,7 @@ class DeleteGraph(foo.Operator):
     def execute(self, ctx):
         store = ctx.store(_get_store_key(ctx))
         graph_id = ctx.params.get("graph_id")
-        store.delete(f"graph_{graph_id}")
-
-        index = store.get("graph_index") or []
-        index = [g for g in index if g["id"] != graph_id]
-        store.set("graph_index", index)
-
+        _delete_graph_entry(store, graph_id)
         return {"status": "ok"}
 
 
@@ -177,24 +515,11 @@ class SaveSharedGraph(foo.Operator):
         graph_json = ctx.params.get("graph_json", "")
 
         try:
-            graph_data = json.loads(graph_json) if isinstance(graph_json, str) else graph_json
+            graph_data = _parse_graph(graph_json)
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
-        graph_id = str(uuid.uuid4())
-        entry = {
-            "id": graph_id,
-            "name": name,
-            "graph": graph_data,
-            "saved_at": time.time(),
-        }
-
-        store.set(f"graph_{graph_id}", entry)
-
-        index = store.get("graph_index") or []
-        index.append({"id": graph_id, "name": name, "saved_at": entry["saved_at"]})
-        store.set("graph_index", index)
-
+        graph_id = _save_graph_entry(store, name, graph_data)
         return {"status": "ok", "graph_id": graph_id}
 
 
@@ -209,8 +534,7 @@ class LoadSharedGraphs(foo.Operator):
 
     def execute(self, ctx):
         store = ctx.store(SHARED_STORE_KEY)
-        index = store.get("graph_index") or []
-        return {"graphs": index}
+        return _list_graphs_response(ctx, store)
 
 
 class LoadSharedGraph(foo.Operator):
@@ -225,7 +549,10 @@ class LoadSharedGraph(foo.Operator):
     def execute(self, ctx):
         store = ctx.store(SHARED_STORE_KEY)
         graph_id = ctx.params.get("graph_id")
-        entry = store.get(f"graph_{graph_id}")
+        try:
+            entry = _load_graph_entry(store, graph_id)
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
         if not entry:
             return {"status": "error", "error": f"Shared graph {graph_id} not found"}
         return {"status": "ok", "data": entry}
@@ -243,17 +570,62 @@ class DeleteSharedGraph(foo.Operator):
     def execute(self, ctx):
         store = ctx.store(SHARED_STORE_KEY)
         graph_id = ctx.params.get("graph_id")
-        store.delete(f"graph_{graph_id}")
-
-        index = store.get("graph_index") or []
-        index = [g for g in index if g["id"] != graph_id]
-        store.set("graph_index", index)
-
+        _delete_graph_entry(store, graph_id)
         return {"status": "ok"}
 
 
 # ─── Get Dataset Info Operator ──────────────────────────────────────
 
+# Curated list of popular zoo models (avoids slow foz.list_zoo_models())
+ZOO_MODELS = (
+    # Detection
+    "faster-rcnn-resnet50-fpn-coco-torch",
+    "ssd300-vgg16-coco-torch",
+    "retinanet-resnet50-fpn-coco-torch",
+    "yolov5s-coco-torch",
+    # Classification
+    "resnet50-imagenet-torch",
+    "resnet101-imagenet-torch",
+    "mobilenet-v2-imagenet-torch",
+    "inception-v3-imagenet-torch",
+    "efficientnet-b0-imagenet-torch",
+    # Segmentation
+    "deeplabv3-resnet50-coco-torch",
+    "deeplabv3-resnet101-coco-torch",
+    # Embeddings
+    "clip-vit-base32-torch",
+    "clip-vit-large14-torch",
+    "open-clip-vit-b-32",
+    "dinov2-vits14-torch",
+    # Zero-shot
+    "zero-shot-classification-transformer-torch",
+    "zero-shot-detection-transformer-torch",
+)
+
+# Field lists reported by GetDatasetInfo and the label types they accept
+_FIELD_BUCKETS = (
+    ("label_fields", LABEL_FQNS),
+    ("patches_fields", PATCHES_FQNS),
+    ("detection_fields", DETECTION_FQNS),
+    ("classification_fields", CLASSIFICATION_FQNS),
+    ("segmentation_fields", SEGMENTATION_FQNS),
+    ("regression_fields", REGRESSION_FQNS),
+)
+
+
+def _build_fqn_buckets():
+    """Map each label FQN to every field list it belongs to."""
+    fqn_buckets = {}
+    for bucket, fqns in _FIELD_BUCKETS:
+        for fqn in fqns:
+            fqn_buckets.setdefault(fqn, []).append(bucket)
+    return {fqn: tuple(names) for fqn, names in fqn_buckets.items()}
+
+
+# One dict lookup classifies a field into all of its buckets
+_FQN_BUCKETS = _build_fqn_buckets()
+
+
 class GetDatasetInfo(foo.Operator):
     @property
     def config(self):
@@ -265,12 +637,6 @@ class GetDatasetInfo(foo.Operator):
         )
 
     def execute(self, ctx):
-        from .nodes import (
-            LABEL_FQNS, PATCHES_FQNS, DETECTION_FQNS,
-            CLASSIFICATION_FQNS, SEGMENTATION_FQNS, REGRESSION_FQNS,
-            VECTOR_FQNS, LABEL_PATH_MAP, get_field_fqn, get_field_type_fqn,
-        )
-
         if not ctx.dataset:
             yield ctx.trigger(
                 "@harpreetsahota/FiftyComfy/dataset_info_loaded",
@@ -283,21 +649,47 @@ class GetDatasetInfo(foo.Operator):
                     "saved_views": [],
                     "tags": [],
                     "label_classes": {},
+                    "label_classes_available": [],
                 },
             )
             return
 
+        # Clients that fetch classes lazily via get_label_classes can skip
+        # the (potentially expensive) eager distinct queries
+        include_label_classes = ctx.params.get("include_label_classes", True)
+
+        store_key = _get_store_key(ctx)
+        cache_key = (store_key, include_label_classes)
+        last_modified_at = ctx.dataset.last_modified_at
+        payload = _get_cached_info(cache_key, last_modified_at)
+        if payload is not None:
+            yield ctx.trigger(
+                "@harpreetsahota/FiftyComfy/dataset_info_loaded",
+                params=payload,
+            )
+            return
+
         schema = ctx.dataset.get_field_schema()
+
+        store = ctx.store(store_key)
+        signature = _dataset_info_signature(
+            ctx.dataset, schema, include_label_classes
+        )
+        cached = store.get(DATASET_INFO_KEY)
+        if cached and cached.get("signature") == signature:
+            _cache_info(cache_key, last_modified_at, cached["payload"])
+            yield ctx.trigger(
+                "@harpreetsahota/FiftyComfy/dataset_info_loaded",
+                params=cached["payload"],
+            )
+            return
+
         fields = list(schema.keys())
 
-        label_fields = []
-        patches_fields = []
-        detection_fields = []
-        classification_fields = []
-        segmentation_fields = []
-        regression_fields = []
+        buckets = {bucket: [] for bucket, _ in _FIELD_BUCKETS}
         vector_fields = []
         label_classes = {}
+        label_paths = {}
 
         for name, field in schema.items():
             # Check field class FQN for non-embedded types (e.g. VectorField)
@@ -308,33 +700,38 @@ class GetDatasetInfo(foo.Operator):
             if fqn is None:
                 continue
 
-            if fqn in LABEL_FQNS:
-                label_fields.append(name)
-
-            if fqn in PATCHES_FQNS:
-                patches_fields.append(name)
-
-            if fqn in DETECTION_FQNS:
-                detection_fields.append(name)
-
-            if fqn in CLASSIFICATION_FQNS:
-                classification_fields.append(name)
-
-            if fqn in SEGMENTATION_FQNS:
-                segmentation_fields.append(name)
-
-            if fqn in REGRESSION_FQNS:
-                regression_fields.append(name)
+            for bucket in _FQN_BUCKETS.get(fqn, ()):
+                buckets[bucket].append(name)
 
             # Collect distinct class labels
             sub_path = LABEL_PATH_MAP.get(fqn)
             if sub_path:
-                try:
-                    vals = ctx.dataset.distinct(f"{name}.{sub_path}")
-                    if vals:
-                        label_classes[name] = vals
-                except Exception:
-                    pass
+                label_paths[name] = name + "." + sub_path
+
+        # Tags and all label classes come back from a single aggregation
+        dataset = ctx.dataset
+        distinct_paths = ["tags"]
+        if include_label_classes:
+            distinct_paths += label_paths.values()
+        results = _run_queries({
+            "saved_views": (dataset.list_saved_views, []),
+            "distinct": (lambda: _distinct_many(dataset, distinct_paths), []),
+            "brain_runs": (dataset.list_brain_runs, []),
+            "evaluations": (dataset.list_evaluations, []),
+        })
+
+        label_fields = buckets["label_fields"]
+        patches_fields = buckets["patches_fields"]
+
+        distinct_values = results["distinct"] or [None] * len(distinct_paths)
+        tags = distinct_values[0] or []
+        for name, vals in zip(label_paths, distinct_values[1:]):
+            if vals:
+                label_classes[name] = vals
+
+        saved_views = results["saved_views"]
+        brain_runs = results["brain_runs"]
+        evaluations = results["evaluations"]
 
         logger.info(
             f"[FiftyComfy] Dataset '{ctx.dataset.name}': "
@@ -344,76 +741,70 @@ class GetDatasetInfo(foo.Operator):
             f"label_classes keys={list(label_classes.keys())}"
         )
 
-        try:
-            saved_views = ctx.dataset.list_saved_views()
-        except Exception:
-            saved_views = []
-
-        try:
-            tags = ctx.dataset.distinct("tags")
-        except Exception:
-            tags = []
-
-        try:
-            brain_runs = ctx.dataset.list_brain_runs()
-        except Exception:
-            brain_runs = []
-
-        try:
-            evaluations = ctx.dataset.list_evaluations()
-        except Exception:
-            evaluations = []
-
-        # Curated list of popular zoo models (avoids slow foz.list_zoo_models())
-        zoo_models = [
-            # Detection
-            "faster-rcnn-resnet50-fpn-coco-torch",
-            "ssd300-vgg16-coco-torch",
-            "retinanet-resnet50-fpn-coco-torch",
-            "yolov5s-coco-torch",
-            # Classification
-            "resnet50-imagenet-torch",
-            "resnet101-imagenet-torch",
-            "mobilenet-v2-imagenet-torch",
-            "inception-v3-imagenet-torch",
-            "efficientnet-b0-imagenet-torch",
-            # Segmentation
-            "deeplabv3-resnet50-coco-torch",
-            "deeplabv3-resnet101-coco-torch",
-            # Embeddings
-            "clip-vit-base32-torch",
-            "clip-vit-large14-torch",
-            "open-clip-vit-b-32",
-            "dinov2-vits14-torch",
-            # Zero-shot
-            "zero-shot-classification-transformer-torch",
-            "zero-shot-detection-transformer-torch",
-        ]
+        payload = {
+            "dataset_name": ctx.dataset.name,
+            "fields": fields,
+            "label_fields": label_fields,
+            "patches_fields": patches_fields,
+            "vector_fields": vector_fields,
+            "saved_views": saved_views,
+            "tags": tags,
+            "detection_fields": buckets["detection_fields"],
+            "classification_fields": buckets["classification_fields"],
+            "segmentation_fields": buckets["segmentation_fields"],
+            "regression_fields": buckets["regression_fields"],
+            "label_classes": label_classes,
+            "label_classes_available": list(label_paths),
+            "brain_runs": brain_runs,
+            "evaluations": evaluations,
+            "zoo_models": ZOO_MODELS,
+        }
+        store.set(
+            DATASET_INFO_KEY,
+            {"signature": signature, "payload": payload},
+            ttl=DATASET_INFO_TTL,
+        )
+        _cache_info(cache_key, last_modified_at, payload)
 
         # Push dataset info to the JS side via ctx.trigger()
         # (executeOperator does NOT return Python results to JS callers)
         yield ctx.trigger(
             "@harpreetsahota/FiftyComfy/dataset_info_loaded",
-            params={
-                "dataset_name": ctx.dataset.name,
-                "fields": fields,
-                "label_fields": label_fields,
-                "patches_fields": patches_fields,
-                "vector_fields": vector_fields,
-                "saved_views": saved_views,
-                "tags": tags,
-                "detection_fields": detection_fields,
-                "classification_fields": classification_fields,
-                "segmentation_fields": segmentation_fields,
-                "regression_fields": regression_fields,
-                "label_classes": label_classes,
-                "brain_runs": brain_runs,
-                "evaluations": evaluations,
-                "zoo_models": zoo_models,
-            },
+            params=payload,
         )
 
 
+# ─── Get Label Classes Operator ─────────────────────────────────────
+
+class GetLabelClasses(foo.Operator):
+    @property
+    def config(self):
+        return foo.OperatorConfig(
+            name="get_label_classes",
+            label="Get Label Classes for FiftyComfy",
+            unlisted=True,
+        )
+
+    def execute(self, ctx):
+        field = ctx.params.get("field", "")
+        if not ctx.dataset or not field:
+            return {"field": field, "classes": []}
+
+        schema = ctx.dataset.get_field_schema()
+        sub_path = None
+        if field in schema:
+            sub_path = LABEL_PATH_MAP.get(get_field_fqn(schema[field]))
+
+        if not sub_path:
+            return {
+                "status": "error",
+                "error": f"Field '{field}' is not a label field",
+            }
+
+        classes = ctx.dataset.distinct(f"{field}.{sub_path}")
+        return {"field": field, "classes": classes}
+
+
 # ─── Registration ───────────────────────────────────────────────────
 
 def register(p):
@@ -431,3 +822,4 @@ def register(p):
     p.register(LoadSharedGraph)
     p.register(DeleteSharedGraph)
     p.register(GetDatasetInfo)
+    p.register(GetLabelClasses)
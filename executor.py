@@ -6,10 +6,35 @@ Only yielded calls actually take effect in the FiftyOne App.
 """
 
 import logging
-from collections import deque
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Number of independent nodes that may run at once. Defaults to serial
+# execution; handlers that write to the dataset (brain runs, model
+# inference) are only safe to overlap on datasets you are not editing
+# elsewhere.
+MAX_WORKERS = max(1, int(os.environ.get("FIFTYCOMFY_MAX_WORKERS", "1")))
+
+
+# Placeholder values offered by the empty-dataset combo widgets in
+# src/litegraph/registerNodes.ts — keep in sync when adding a widget
+_PLACEHOLDERS = frozenset({
+    "(no brain runs)",
+    "(no classification fields)",
+    "(no detection fields)",
+    "(no embedding fields)",
+    "(no evaluations)",
+    "(no fields)",
+    "(no label fields)",
+    "(no models available)",
+    "(no patchable fields)",
+    "(no regression fields)",
+    "(no saved views)",
+    "(no segmentation fields)",
+})
+
 
 def _validate_properties(properties, node_title):
     """Raise ValueError if any property contains a placeholder dropdown value.
@@ -22,18 +47,131 @@ def _validate_properties(properties, node_title):
     Catch them early with a clear message.
     """
     for key, value in properties.items():
-        if isinstance(value, str) and value.startswith("(no ") and value.endswith(")"):
+        if isinstance(value, str) and value in _PLACEHOLDERS:
             raise ValueError(
                 f"'{node_title}' — '{key}' has no valid selection: {value}. "
                 f"Please ensure your dataset has the required fields."
             )
 
 
+def _build_graph_index(nodes, links):
+    """Build child/parent adjacency in one pass over links.
+
+    Multiple links between the same pair of nodes (e.g., several slot
+    connections) count as a single dependency.
+    """
+    children = {nid: [] for nid in nodes}
+    parents = {nid: [] for nid in nodes}
+    seen = set()
+
+    for link in links:
+        link_id, origin_id, origin_slot, target_id, target_slot, link_type = link
+        edge = (origin_id, target_id)
+        if origin_id in nodes and target_id in nodes and edge not in seen:
+            seen.add(edge)
+            children[origin_id].append(target_id)
+            parents[target_id].append(origin_id)
+
+    return children, parents
+
+
+_WHITE, _GRAY, _BLACK = 0, 1, 2
+
+
+def _dfs_topo(parents, node_ids):
+    """Topologically order ``node_ids`` with an iterative DFS over parents.
+
+    Parents are emitted in post-order, so every node follows all of its
+    dependencies, and independent branches keep the graph's node order.
+
+    Returns ``(order, cycle_node)``; ``cycle_node`` is the first node found
+    on a cycle, or ``None`` when the graph is acyclic.
+    """
+    state = dict.fromkeys(node_ids, _WHITE)
+    order = []
+
+    for root in node_ids:
+        if state[root] != _WHITE:
+            continue
+        state[root] = _GRAY
+        stack = [(root, iter(parents[root]))]
+        while stack:
+            nid, it = stack[-1]
+            for parent in it:
+                mark = state[parent]
+                if mark == _WHITE:
+                    state[parent] = _GRAY
+                    stack.append((parent, iter(parents[parent])))
+                    break
+                if mark == _GRAY:
+                    return order, parent
+            else:
+                stack.pop()
+                state[nid] = _BLACK
+                order.append(nid)
+
+    return order, None
+
+
+def _topo_order(children, parents, node_ids):
+    """Return ``(order, cycle_node)``, short-circuiting the common shapes.
+
+    Graphs with no links keep their node order, and a single linear chain
+    is followed directly from its source; anything else goes through
+    :func:`_dfs_topo`.
+    """
+    roots = [nid for nid in node_ids if not parents[nid]]
+    if len(roots) == len(node_ids):
+        return list(node_ids), None
+
+    if len(roots) == 1 and all(len(c) <= 1 for c in children.values()):
+        order = [roots[0]]
+        for _ in range(len(node_ids) - 1):
+            child = children[order[-1]]
+            if not child:
+                break
+            order.append(child[0])
+        if len(order) == len(node_ids) and not children[order[-1]]:
+            return order, None
+
+    return _dfs_topo(parents, node_ids)
+
+
+def _release_parents(node_id, parents, pending, results):
+    """Drop parent outputs once their last child has been visited."""
+    for parent_id in parents[node_id]:
+        pending[parent_id] -= 1
+        if not pending[parent_id]:
+            results.pop(parent_id, None)
+
+
+def _execution_waves(plan, parents, parallel):
+    """Group plan entries into waves of nodes that can run together.
+
+    Serial execution keeps one node per wave in plan order. Otherwise each
+    wave holds every node whose parents all ran in earlier waves.
+    """
+    if not parallel:
+        return [[entry] for entry in plan]
+
+    level = {}
+    waves = []
+    for entry in plan:
+        node_id = entry[0]
+        lvl = 1 + max((level[p] for p in parents[node_id]), default=-1)
+        level[node_id] = lvl
+        if lvl == len(waves):
+            waves.append([])
+        waves[lvl].append(entry)
+    return waves
+
+
 class GraphExecutor:
     """Execute a LiteGraph-serialized graph topologically."""
 
-    def __init__(self, node_registry):
+    def __init__(self, node_registry, max_workers=None):
         self.registry = node_registry
+        self.max_workers = max_workers or MAX_WORKERS
 
     def execute(self, ctx, graph_data):
         nodes = {n["id"]: n for n in graph_data.get("nodes", [])}
@@ -43,100 +181,147 @@ class GraphExecutor:
             return
 
         # ----- Build adjacency -----
-        children = {nid: [] for nid in nodes}
-        parents = {nid: [] for nid in nodes}
-
-        for link in links:
-            link_id, origin_id, origin_slot, target_id, target_slot, link_type = link
-            if origin_id in nodes and target_id in nodes:
-                children[origin_id].append(target_id)
-                parents[target_id].append(origin_id)
-
-        # ----- Topological sort (Kahn's algorithm) -----
-        in_degree = {nid: len(set(parents[nid])) for nid in nodes}
-        queue = deque([nid for nid, deg in in_degree.items() if deg == 0])
-        execution_order = []
-
-        while queue:
-            nid = queue.popleft()
-            execution_order.append(nid)
-            visited_children = set()
-            for child in children[nid]:
-                if child not in visited_children:
-                    visited_children.add(child)
-                    in_degree[child] -= 1
-                    if in_degree[child] == 0:
-                        queue.append(child)
-
-        if len(execution_order) != len(nodes):
+        children, parents = _build_graph_index(nodes, links)
+
+        # ----- Topological sort -----
+        execution_order, cycle_node = _topo_order(children, parents, list(nodes))
+
+        if cycle_node is not None:
             yield ctx.ops.notify("Graph contains a cycle!", variant="error")
             return
 
-        # ----- Execute each node -----
-        results = {}
-        failed_nodes = set()
-        total = len(execution_order)
-        final_view = None  # Track the last view for Set App View
-        set_view_count = 0  # Track multiple Set App View nodes
-
-        for idx, node_id in enumerate(execution_order):
+        # ----- Resolve handlers and titles once per node type -----
+        node_types = {n.get("type", "") for n in nodes.values()}
+        get_execute = self.registry.get_execute
+        handlers = {t: get_execute(t) for t in node_types}
+        titles = {t: t.rpartition("/")[2] for t in node_types}
+        source_types = self.registry.source_types
+        source_ids = {
+            nid for nid, n in nodes.items() if n.get("type", "") in source_types
+        }
+
+        # ----- Build the execution plan, catching static config errors -----
+        plan = []
+        invalid = []
+        for node_id in execution_order:
             node = nodes[node_id]
             node_type = node.get("type", "")
+            run = handlers[node_type]
+            node_title = titles[node_type]
             properties = node.get("properties", {})
-
             if "widgets_values" in node:
                 properties = dict(properties)
 
-            # Skip if parent failed
-            if any(p in failed_nodes for p in parents[node_id]):
-                failed_nodes.add(node_id)
-                continue
+            try:
+                if run is None:
+                    raise ValueError(f"No handler for: {node_type}")
+                _validate_properties(properties, node_title)
+            except ValueError as e:
+                invalid.append((node_id, node_type, node_title, e))
+
+            plan.append((node_id, node_type, run, node_title, properties))
+
+        # ----- Execute each node -----
+        results = {}
+        pending = {nid: len(c) for nid, c in children.items()}
+        failed_nodes = set()
+        poisoned = set()  # Nodes downstream of a failure
+        total = len(execution_order)
+        final_view = None  # Track the last view for Set App View
+        set_view_count = 0  # Track multiple Set App View nodes
 
-            # Progress
-            node_title = node_type.split("/")[-1] if "/" in node_type else node_type
-            yield ctx.ops.set_progress(
-                progress=(idx / total),
-                label=f"Running: {node_title} ({idx + 1}/{total})",
+        # Report invalid nodes up front; they and their descendants are
+        # skipped when their turn comes
+        for node_id, node_type, node_title, error in invalid:
+            logger.error(f"Node {node_id} ({node_type}) failed: {error}")
+            poisoned.add(node_id)
+            yield ctx.ops.notify(
+                f"Node '{node_title}' failed: {error}",
+                variant="error",
             )
 
-            try:
+        idx = 0
+        last_pct = -1
+        for wave in _execution_waves(plan, parents, self.max_workers > 1):
+            # Resolve inputs and run the pre-flight checks for the wave
+            prepared = []
+            for entry in wave:
+                node_id, node_type, run, node_title, properties = entry
+                step = idx
+                idx += 1
+
+                # Skip if this node is invalid or a parent failed
+                if node_id in poisoned:
+                    failed_nodes.add(node_id)
+                    poisoned.update(children[node_id])
+                    _release_parents(node_id, parents, pending, results)
+                    continue
+
+                # Progress — at most one update per percent
+                pct = (step * 100) // total
+                if pct != last_pct:
+                    last_pct = pct
+                    yield ctx.ops.set_progress(
+                        progress=pct / 100,
+                        label=f"Running: {node_title} ({step + 1}/{total})",
+                    )
+
                 # Get input view from parent
                 input_view = None
-                for parent_id in parents.get(node_id, []):
-                    if parent_id in results and results[parent_id] is not None:
-                        input_view = results[parent_id]
+                for parent_id in parents[node_id]:
+                    input_view = results.get(parent_id)
+                    if input_view is not None:
                         break
-
-                handler = self.registry.get_handler(node_type)
-                if handler is None:
-                    raise ValueError(f"No handler for: {node_type}")
+                _release_parents(node_id, parents, pending, results)
 
                 # Guard: non-source nodes must have an input view
-                if input_view is None and handler.category != "source":
-                    raise ValueError(
+                error = None
+                if input_view is None and node_id not in source_ids:
+                    error = ValueError(
                         f"No input connected — connect a Source node "
                         f"upstream of '{node_title}'"
                     )
 
-                _validate_properties(properties, node_title)
-                output = handler.execute(input_view, properties, ctx)
-                results[node_id] = output
-
-                # If this is a "Set App View" node, remember the view
-                if node_type == "FiftyComfy/Output/Set App View" and output is not None:
-                    if final_view is not None:
-                        set_view_count += 1
-                    final_view = output
-
-                logger.info(f"Node {node_id} ({node_type}) complete")
-
-            except Exception as e:
-                logger.exception(f"Node {node_id} ({node_type}) failed: {e}")
-                failed_nodes.add(node_id)
-                yield ctx.ops.notify(
-                    f"Node '{node_title}' failed: {e}",
-                    variant="error",
-                )
+                prepared.append((entry, input_view, error))
+
+            # Independent nodes in the same wave run concurrently
+            futures = [None] * len(prepared)
+            runnable = [i for i, (_, _, error) in enumerate(prepared) if error is None]
+            if len(runnable) > 1:
+                workers = min(self.max_workers, len(runnable))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    for i in runnable:
+                        (_, _, run, _, properties), input_view, _ = prepared[i]
+                        futures[i] = pool.submit(run, input_view, properties, ctx)
+
+            for (entry, input_view, error), future in zip(prepared, futures):
+                node_id, node_type, run, node_title, properties = entry
+                try:
+                    if error is not None:
+                        raise error
+                    if future is not None:
+                        output = future.result()
+                    else:
+                        output = run(input_view, properties, ctx)
+                    if pending[node_id]:
+                        results[node_id] = output
+
+                    # If this is a "Set App View" node, remember the view
+                    if node_type == "FiftyComfy/Output/Set App View" and output is not None:
+                        if final_view is not None:
+                            set_view_count += 1
+                        final_view = output
+
+                    logger.info(f"Node {node_id} ({node_type}) complete")
+
+                except Exception as e:
+                    logger.exception(f"Node {node_id} ({node_type}) failed: {e}")
+                    failed_nodes.add(node_id)
+                    poisoned.update(children[node_id])
+                    yield ctx.ops.notify(
+                        f"Node '{node_title}' failed: {e}",
+                        variant="error",
+                    )
 
         # ----- Dismiss the progress bar -----
         yield ctx.ops.set_progress(progress=1, label="Complete")
@@ -5,7 +5,12 @@ Each node handler maps a LiteGraph node type string to a Python
 execution function.
 """
 
+import importlib
 import logging
+import sys
+import threading
+from functools import lru_cache
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
@@ -15,53 +20,53 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 # Label types that support filter_labels / match_labels
-LABEL_FQNS = {
+LABEL_FQNS = frozenset({
     "fiftyone.core.labels.Classification",
     "fiftyone.core.labels.Classifications",
     "fiftyone.core.labels.Detections",
     "fiftyone.core.labels.Polylines",
     "fiftyone.core.labels.Keypoints",
-}
+})
 
 # Subset that supports to_patches() and evaluate_detections()
-PATCHES_FQNS = {
+PATCHES_FQNS = frozenset({
     "fiftyone.core.labels.Detections",
     "fiftyone.core.labels.Polylines",
     "fiftyone.core.labels.Keypoints",
-}
+})
 
 # Detection-type fields (for evaluate_detections)
-DETECTION_FQNS = {
+DETECTION_FQNS = frozenset({
     "fiftyone.core.labels.Detections",
     "fiftyone.core.labels.Polylines",
     "fiftyone.core.labels.Keypoints",
-}
+})
 
 # Classification-type fields (for evaluate_classifications)
-CLASSIFICATION_FQNS = {
+CLASSIFICATION_FQNS = frozenset({
     "fiftyone.core.labels.Classification",
     "fiftyone.core.labels.Classifications",
-}
+})
 
 # Keypoint-type fields (for filter_keypoints)
-KEYPOINT_FQNS = {
+KEYPOINT_FQNS = frozenset({
     "fiftyone.core.labels.Keypoints",
-}
+})
 
 # Segmentation-type fields (for evaluate_segmentations)
-SEGMENTATION_FQNS = {
+SEGMENTATION_FQNS = frozenset({
     "fiftyone.core.labels.Segmentation",
-}
+})
 
 # Regression-type fields (for evaluate_regressions)
-REGRESSION_FQNS = {
+REGRESSION_FQNS = frozenset({
     "fiftyone.core.labels.Regression",
-}
+})
 
 # Vector/embedding fields (for brain nodes that accept pre-computed embeddings)
-VECTOR_FQNS = {
+VECTOR_FQNS = frozenset({
     "fiftyone.core.fields.VectorField",
-}
+})
 
 # Map FQN -> sub-field path for distinct label queries
 LABEL_PATH_MAP = {
@@ -90,39 +95,97 @@ def get_field_type_fqn(field):
     return f"{type(field).__module__}.{type(field).__name__}"
 
 
-def require_field_type(ctx, field_name, allowed_fqns, node_title):
+# Successful field type checks, keyed by (dataset id, last_modified_at,
+# field name, allowed FQNs). Only passes are cached, so a stale entry can
+# never reject a field.
+_FIELD_TYPE_OK = set()
+_FIELD_TYPE_OK_SIZE = 256
+
+
+def _field_type_key(ctx, field_name, allowed_fqns):
+    dataset = ctx.dataset
+    return (dataset._doc.id, dataset.last_modified_at, field_name, allowed_fqns)
+
+
+def require_field_type(ctx, field_name, allowed_fqns, node_title, schema=None):
     """Verify a dataset field exists and is one of the allowed types.
 
+    Pass ``schema`` when checking several fields so the dataset schema is
+    only read once.
+
     Raises ValueError with a clear message if the field is missing or
     has the wrong type.
     """
     if not field_name:
         raise ValueError(f"'{node_title}' — no field specified")
 
-    schema = ctx.dataset.get_field_schema()
-    if field_name not in schema:
+    key = _field_type_key(ctx, field_name, allowed_fqns)
+    if key in _FIELD_TYPE_OK:
+        return
+
+    if schema is None:
+        schema = ctx.dataset.get_field_schema()
+    field = schema.get(field_name)
+    if field is None:
         raise ValueError(
             f"'{node_title}' — field '{field_name}' does not exist on "
             f"this dataset"
         )
 
-    fqn = get_field_fqn(schema[field_name])
+    fqn = get_field_fqn(field)
+    if fqn in allowed_fqns:
+        if len(_FIELD_TYPE_OK) >= _FIELD_TYPE_OK_SIZE:
+            _FIELD_TYPE_OK.clear()
+        _FIELD_TYPE_OK.add(key)
+        return
 
     # For non-embedded fields (e.g., StringField, FloatField) fqn is None
     if fqn is None and allowed_fqns:
-        allowed_names = [f.split(".")[-1] for f in allowed_fqns]
         raise ValueError(
             f"'{node_title}' — field '{field_name}' is not one of the "
-            f"required types: {', '.join(allowed_names)}"
+            f"required types: {_short_type_names(allowed_fqns)}"
         )
 
-    if fqn not in allowed_fqns:
-        actual_name = fqn.split(".")[-1] if fqn else "unknown"
-        allowed_names = [f.split(".")[-1] for f in allowed_fqns]
-        raise ValueError(
-            f"'{node_title}' — field '{field_name}' is {actual_name}, "
-            f"but this node requires: {', '.join(allowed_names)}"
-        )
+    actual_name = fqn.rpartition(".")[2] if fqn else "unknown"
+    raise ValueError(
+        f"'{node_title}' — field '{field_name}' is {actual_name}, "
+        f"but this node requires: {_short_type_names(allowed_fqns)}"
+    )
+
+
+def require_field_types(ctx, field_names, allowed_fqns, node_title):
+    """Verify several fields with :func:`require_field_type`.
+
+    The dataset schema is read at most once, and not at all when every
+    field has already passed against the current dataset state.
+    """
+    schema = None
+    for field_name in field_names:
+        if (
+            schema is None
+            and field_name
+            and _field_type_key(ctx, field_name, allowed_fqns) not in _FIELD_TYPE_OK
+        ):
+            schema = ctx.dataset.get_field_schema()
+        require_field_type(ctx, field_name, allowed_fqns, node_title, schema=schema)
+
+
+@lru_cache(maxsize=None)
+def _short_type_names(allowed_fqns):
+    """Comma-separated class names for an FQN set, for error messages."""
+    return ", ".join(sorted(f.rpartition(".")[2] for f in allowed_fqns))
+
+
+@lru_cache(maxsize=2)
+def load_zoo_model(model_name):
+    """Load a zoo model, reusing recently loaded instances.
+
+    Models can hold gigabytes of weights, so only the two most recently
+    used are kept. Call ``load_zoo_model.cache_clear()`` to release them.
+    """
+    import fiftyone.zoo as foz
+
+    return foz.load_zoo_model(model_name)
 
 
 class NodeHandler:
@@ -155,14 +218,39 @@ class NodeRegistry:
 
     def __init__(self):
         self._handlers: dict[str, NodeHandler] = {}
+        self._get = self._handlers.get
+        self._get_execute = {}.get
+        self.source_types: frozenset[str] = frozenset()
 
     def register(self, handler: NodeHandler):
         """Register a node handler instance."""
-        self._handlers[handler.node_type] = handler
+        if handler.node_type in self._handlers:
+            raise ValueError(
+                f"Duplicate node handler for: {handler.node_type}"
+            )
+        self._handlers[sys.intern(handler.node_type)] = handler
+
+    def freeze(self):
+        """Make the registry read-only and precompute derived lookups."""
+        self._handlers = MappingProxyType(dict(self._handlers))
+        self._get = self._handlers.get
+        self._get_execute = MappingProxyType(
+            {t: h.execute for t, h in self._handlers.items()}
+        ).get
+        self.source_types = frozenset(
+            t for t, h in self._handlers.items() if h.category == "source"
+        )
 
     def get_handler(self, node_type: str) -> NodeHandler | None:
         """Look up a handler by LiteGraph node type string."""
-        return self._handlers.get(node_type)
+        return self._get(node_type)
+
+    def get_execute(self, node_type: str):
+        """Look up a handler's bound execute method by node type string.
+
+        Only available once the registry has been frozen.
+        """
+        return self._get_execute(node_type)
 
     def list_types(self) -> list[str]:
         """Return all registered node type strings."""
@@ -174,6 +262,7 @@ class NodeRegistry:
 # ---------------------------------------------------------------------------
 
 _registry: NodeRegistry | None = None
+_registry_lock = threading.Lock()
 
 
 def get_node_registry() -> NodeRegistry:
@@ -182,33 +271,51 @@ def get_node_registry() -> NodeRegistry:
     if _registry is not None:
         return _registry
 
-    _registry = NodeRegistry()
-
-    # Import and register all handler modules
-    from .source import HANDLERS as source_handlers
-    from .view_stages import HANDLERS as view_stage_handlers
-    from .brain import HANDLERS as brain_handlers
-    from .model import HANDLERS as model_handlers
-    from .evaluation import HANDLERS as evaluation_handlers
-    from .aggregations import HANDLERS as aggregation_handlers
-    from .output import HANDLERS as output_handlers
-
-    all_handlers = (
-        source_handlers
-        + view_stage_handlers
-        + brain_handlers
-        + model_handlers
-        + evaluation_handlers
-        + aggregation_handlers
-        + output_handlers
-    )
+    with _registry_lock:
+        if _registry is None:
+            _registry = _build_registry()
+
+    return _registry
+
+
+_HANDLER_MODULES = (
+    "source",
+    "view_stages",
+    "brain",
+    "model",
+    "evaluation",
+    "aggregations",
+    "output",
+)
+
+
+def _build_registry() -> NodeRegistry:
+    """Import all handler modules and register their handlers.
+
+    The registry is only published once fully populated, so concurrent
+    callers never observe a partially registered instance.
+    """
+    registry = NodeRegistry()
+
+    # Import and register all handler modules; a module that fails to
+    # import only loses its own nodes
+    all_handlers = []
+    for name in _HANDLER_MODULES:
+        try:
+            module = importlib.import_module(f".{name}", __name__)
+        except Exception as e:
+            logger.warning(f"FiftyComfy: skipping '{name}' node handlers: {e}")
+            continue
+        all_handlers.extend(module.HANDLERS)
 
     for handler in all_handlers:
-        _registry.register(handler)
+        registry.register(handler)
         logger.debug(f"Registered node handler: {handler.node_type}")
 
+    registry.freeze()
+
     logger.info(
         f"FiftyComfy: Registered {len(all_handlers)} node handlers"
     )
 
-    return _registry
+    return registry
@@ -5,4 +5,4 @@ as they don't impact the visible view and aren't useful for the panel workflow.
 """
 
 # All handlers in this module
-HANDLERS = []
+HANDLERS = ()
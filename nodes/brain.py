@@ -6,10 +6,31 @@ Cross-referenced against actual API signatures:
 """
 
 import logging
-from . import NodeHandler
+import re
+from functools import lru_cache
+
+from . import NodeHandler, load_zoo_model
 
 logger = logging.getLogger(__name__)
 
+# Separator for comma-separated list params, e.g. "train, test"
+_SPLIT_RE = re.compile(r"\s*,\s*")
+
+
+# fiftyone.brain is slow to import, so it is only loaded the first time
+# a node needs it
+
+
+@lru_cache(maxsize=None)
+def _fob():
+    import fiftyone.brain as fob
+    return fob
+
+
+# (dataset id, view stages, model, field) -> dataset.last_modified_at as
+# recorded right after Compute Embeddings wrote the field
+_EMBEDDINGS_RUNS = {}
+
 
 class ComputeEmbeddingsHandler(NodeHandler):
     """Compute embeddings using a zoo model.
@@ -23,13 +44,30 @@ class ComputeEmbeddingsHandler(NodeHandler):
     category = "brain"
 
     def execute(self, input_view, params, ctx):
-        import fiftyone.zoo as foz
-
         model_name = params.get("model", "clip-vit-base32-torch")
         field = params.get("embeddings_field", "embeddings")
 
-        model = foz.load_zoo_model(model_name)
+        # Re-running a workflow should not recompute embeddings that this
+        # process just wrote for the same view, model, and field
+        dataset = input_view._dataset
+        key = (
+            dataset._doc.id,
+            tuple(repr(stage) for stage in input_view.view()._stages),
+            model_name,
+            field,
+        )
+        if (
+            _EMBEDDINGS_RUNS.get(key) == dataset.last_modified_at
+            and input_view.exists(field, False).count() == 0
+        ):
+            logger.info(
+                f"[FiftyComfy] Reusing '{field}' embeddings from {model_name}"
+            )
+            return input_view
+
+        model = load_zoo_model(model_name)
         input_view.compute_embeddings(model, embeddings_field=field)
+        _EMBEDDINGS_RUNS[key] = dataset.last_modified_at
         return input_view
 
 
@@ -48,7 +86,7 @@ class ComputeVisualizationHandler(NodeHandler):
     category = "brain"
 
     def execute(self, input_view, params, ctx):
-        import fiftyone.brain as fob
+        fob = _fob()
 
         kwargs = {
             "brain_key": params.get("brain_key", "visualization"),
@@ -80,7 +118,7 @@ class ComputeSimilarityHandler(NodeHandler):
     category = "brain"
 
     def execute(self, input_view, params, ctx):
-        import fiftyone.brain as fob
+        fob = _fob()
 
         kwargs = {"brain_key": params.get("brain_key", "similarity")}
 
@@ -112,7 +150,7 @@ class ComputeUniquenessHandler(NodeHandler):
     category = "brain"
 
     def execute(self, input_view, params, ctx):
-        import fiftyone.brain as fob
+        fob = _fob()
 
         kwargs = {
             "uniqueness_field": params.get("uniqueness_field", "uniqueness"),
@@ -145,7 +183,7 @@ class ComputeRepresentativenessHandler(NodeHandler):
     category = "brain"
 
     def execute(self, input_view, params, ctx):
-        import fiftyone.brain as fob
+        fob = _fob()
 
         kwargs = {
             "representativeness_field": params.get(
@@ -181,7 +219,7 @@ class ComputeMistakennessHandler(NodeHandler):
     category = "brain"
 
     def execute(self, input_view, params, ctx):
-        import fiftyone.brain as fob
+        fob = _fob()
 
         pred_field = params.get("pred_field", "")
         label_field = params.get("label_field", "")
@@ -215,7 +253,7 @@ class ComputeHardnessHandler(NodeHandler):
     category = "brain"
 
     def execute(self, input_view, params, ctx):
-        import fiftyone.brain as fob
+        fob = _fob()
 
         predictions_field = params.get("predictions_field", "")
         hardness_field = params.get("hardness_field", "hardness")
@@ -241,7 +279,7 @@ class ComputeExactDuplicatesHandler(NodeHandler):
     category = "brain"
 
     def execute(self, input_view, params, ctx):
-        import fiftyone.brain as fob
+        fob = _fob()
 
         fob.compute_exact_duplicates(input_view)
         return input_view
@@ -262,7 +300,7 @@ class ComputeNearDuplicatesHandler(NodeHandler):
     category = "brain"
 
     def execute(self, input_view, params, ctx):
-        import fiftyone.brain as fob
+        fob = _fob()
 
         kwargs = {}
 
@@ -296,11 +334,11 @@ class ComputeLeakySplitsHandler(NodeHandler):
     category = "brain"
 
     def execute(self, input_view, params, ctx):
-        import fiftyone.brain as fob
+        fob = _fob()
 
         splits = params.get("splits", "train,test")
         if isinstance(splits, str):
-            splits = [s.strip() for s in splits.split(",") if s.strip()]
+            splits = [s for s in _SPLIT_RE.split(splits.strip()) if s]
 
         kwargs = {"splits": splits}
 
@@ -363,7 +401,7 @@ class ManageBrainRunHandler(NodeHandler):
 
 
 # All handlers in this module
-HANDLERS = [
+HANDLERS = (
     ComputeEmbeddingsHandler(),
     ComputeVisualizationHandler(),
     ComputeSimilarityHandler(),
@@ -375,4 +413,4 @@ HANDLERS = [
     ComputeNearDuplicatesHandler(),
     ComputeLeakySplitsHandler(),
     ManageBrainRunHandler(),
-]
+)
@@ -10,12 +10,25 @@ from . import (
     CLASSIFICATION_FQNS,
     SEGMENTATION_FQNS,
     REGRESSION_FQNS,
-    require_field_type,
+    require_field_types,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def _read_eval_params(params):
+    """Read the prediction/ground truth fields and eval key of an Evaluate node."""
+    pred_field = params.get("pred_field", "")
+    if not pred_field:
+        raise ValueError("No predictions field specified")
+
+    gt_field = params.get("gt_field", "")
+    if not gt_field:
+        raise ValueError("No ground truth field specified")
+
+    return pred_field, gt_field, params.get("eval_key") or "eval"
+
+
 class EvaluateDetectionsHandler(NodeHandler):
     """Evaluate object detection predictions against ground truth.
 
@@ -28,29 +41,17 @@ class EvaluateDetectionsHandler(NodeHandler):
     category = "evaluation"
 
     def execute(self, input_view, params, ctx):
-        pred_field = params.get("pred_field", "")
-        gt_field = params.get("gt_field", "")
-        eval_key = params.get("eval_key", "eval")
+        pred_field, gt_field, eval_key = _read_eval_params(params)
         method = params.get("method", "coco")
 
-        if not pred_field:
-            raise ValueError("No predictions field specified")
-        if not gt_field:
-            raise ValueError("No ground truth field specified")
-        if not eval_key:
-            eval_key = "eval"
-
         # Guard: verify fields are detection-compatible types
-        require_field_type(
-            ctx, pred_field, DETECTION_FQNS, "Evaluate Detections"
-        )
-        require_field_type(
-            ctx, gt_field, DETECTION_FQNS, "Evaluate Detections"
+        require_field_types(
+            ctx, (pred_field, gt_field), DETECTION_FQNS, "Evaluate Detections"
         )
 
         logger.info(
-            f"[FiftyComfy] Evaluating detections: "
-            f"pred={pred_field}, gt={gt_field}, key={eval_key}, method={method}"
+            "[FiftyComfy] Evaluating detections: pred=%s, gt=%s, key=%s, method=%s",
+            pred_field, gt_field, eval_key, method,
         )
 
         kwargs = {
@@ -75,28 +76,16 @@ class EvaluateClassificationsHandler(NodeHandler):
     category = "evaluation"
 
     def execute(self, input_view, params, ctx):
-        pred_field = params.get("pred_field", "")
-        gt_field = params.get("gt_field", "")
-        eval_key = params.get("eval_key", "eval")
-
-        if not pred_field:
-            raise ValueError("No predictions field specified")
-        if not gt_field:
-            raise ValueError("No ground truth field specified")
-        if not eval_key:
-            eval_key = "eval"
+        pred_field, gt_field, eval_key = _read_eval_params(params)
 
         # Guard: verify fields are classification types
-        require_field_type(
-            ctx, pred_field, CLASSIFICATION_FQNS, "Evaluate Classifications"
-        )
-        require_field_type(
-            ctx, gt_field, CLASSIFICATION_FQNS, "Evaluate Classifications"
+        require_field_types(
+            ctx, (pred_field, gt_field), CLASSIFICATION_FQNS, "Evaluate Classifications"
         )
 
         logger.info(
-            f"[FiftyComfy] Evaluating classifications: "
-            f"pred={pred_field}, gt={gt_field}, key={eval_key}"
+            "[FiftyComfy] Evaluating classifications: pred=%s, gt=%s, key=%s",
+            pred_field, gt_field, eval_key,
         )
 
         input_view.evaluate_classifications(
@@ -118,29 +107,17 @@ class EvaluateSegmentationsHandler(NodeHandler):
     category = "evaluation"
 
     def execute(self, input_view, params, ctx):
-        pred_field = params.get("pred_field", "")
-        gt_field = params.get("gt_field", "")
-        eval_key = params.get("eval_key", "eval")
+        pred_field, gt_field, eval_key = _read_eval_params(params)
         method = params.get("method", "simple")
 
-        if not pred_field:
-            raise ValueError("No predictions field specified")
-        if not gt_field:
-            raise ValueError("No ground truth field specified")
-        if not eval_key:
-            eval_key = "eval"
-
         # Guard: verify fields are segmentation types
-        require_field_type(
-            ctx, pred_field, SEGMENTATION_FQNS, "Evaluate Segmentations"
-        )
-        require_field_type(
-            ctx, gt_field, SEGMENTATION_FQNS, "Evaluate Segmentations"
+        require_field_types(
+            ctx, (pred_field, gt_field), SEGMENTATION_FQNS, "Evaluate Segmentations"
         )
 
         logger.info(
-            f"[FiftyComfy] Evaluating segmentations: "
-            f"pred={pred_field}, gt={gt_field}, key={eval_key}, method={method}"
+            "[FiftyComfy] Evaluating segmentations: pred=%s, gt=%s, key=%s, method=%s",
+            pred_field, gt_field, eval_key, method,
         )
 
         kwargs = {
@@ -165,29 +142,17 @@ class EvaluateRegressionsHandler(NodeHandler):
     category = "evaluation"
 
     def execute(self, input_view, params, ctx):
-        pred_field = params.get("pred_field", "")
-        gt_field = params.get("gt_field", "")
-        eval_key = params.get("eval_key", "eval")
+        pred_field, gt_field, eval_key = _read_eval_params(params)
         method = params.get("method", "simple")
 
-        if not pred_field:
-            raise ValueError("No predictions field specified")
-        if not gt_field:
-            raise ValueError("No ground truth field specified")
-        if not eval_key:
-            eval_key = "eval"
-
         # Guard: verify fields are regression types
-        require_field_type(
-            ctx, pred_field, REGRESSION_FQNS, "Evaluate Regressions"
-        )
-        require_field_type(
-            ctx, gt_field, REGRESSION_FQNS, "Evaluate Regressions"
+        require_field_types(
+            ctx, (pred_field, gt_field), REGRESSION_FQNS, "Evaluate Regressions"
         )
 
         logger.info(
-            f"[FiftyComfy] Evaluating regressions: "
-            f"pred={pred_field}, gt={gt_field}, key={eval_key}, method={method}"
+            "[FiftyComfy] Evaluating regressions: pred=%s, gt=%s, key=%s, method=%s",
+            pred_field, gt_field, eval_key, method,
         )
 
         kwargs = {
@@ -274,13 +239,13 @@ class ManageEvaluationHandler(NodeHandler):
 
         if action == "delete":
             ctx.dataset.delete_evaluation(eval_key)
-            logger.info(f"[FiftyComfy] Deleted evaluation: {eval_key}")
+            logger.info("[FiftyComfy] Deleted evaluation: %s", eval_key)
         elif action == "rename":
             if not new_name:
                 raise ValueError("No new name specified for rename")
             ctx.dataset.rename_evaluation(eval_key, new_name)
             logger.info(
-                f"[FiftyComfy] Renamed evaluation: {eval_key} -> {new_name}"
+                "[FiftyComfy] Renamed evaluation: %s -> %s", eval_key, new_name
             )
         else:
             raise ValueError(f"Unknown action: {action}")
@@ -289,11 +254,11 @@ class ManageEvaluationHandler(NodeHandler):
 
 
 # All handlers in this module
-HANDLERS = [
+HANDLERS = (
     EvaluateDetectionsHandler(),
     EvaluateClassificationsHandler(),
     EvaluateSegmentationsHandler(),
     EvaluateRegressionsHandler(),
     ToEvaluationPatchesHandler(),
     ManageEvaluationHandler(),
-]
+)
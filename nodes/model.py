@@ -4,7 +4,7 @@ Ref: https://docs.voxel51.com/model_zoo/api.html
 """
 
 import logging
-from . import NodeHandler
+from . import NodeHandler, load_zoo_model
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +20,6 @@ class ApplyZooModelHandler(NodeHandler):
     category = "model"
 
     def execute(self, input_view, params, ctx):
-        import fiftyone.zoo as foz
-
         model_name = params.get("model", "")
         if not model_name:
             raise ValueError("No model selected")
@@ -38,15 +36,16 @@ class ApplyZooModelHandler(NodeHandler):
 
         store_logits = params.get("store_logits", False)
 
-        logger.info(
-            f"[FiftyComfy] Loading zoo model: {model_name}"
-        )
-        model = foz.load_zoo_model(model_name)
+        logger.info("[FiftyComfy] Loading zoo model: %s", model_name)
+        model = load_zoo_model(model_name)
 
-        logger.info(
-            f"[FiftyComfy] Applying model to {len(input_view)} samples, "
-            f"label_field={label_field}"
-        )
+        # Counting the view is a database query; only pay for it when the
+        # message will actually be logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[FiftyComfy] Applying model to %d samples, label_field=%s",
+                len(input_view), label_field,
+            )
         kwargs = {"label_field": label_field}
         if confidence_thresh is not None:
             kwargs["confidence_thresh"] = confidence_thresh
@@ -58,6 +57,6 @@ class ApplyZooModelHandler(NodeHandler):
 
 
 # All handlers in this module
-HANDLERS = [
+HANDLERS = (
     ApplyZooModelHandler(),
-]
+)
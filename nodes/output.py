@@ -45,7 +45,7 @@ class SaveViewHandler(NodeHandler):
 
 
 # All handlers in this module
-HANDLERS = [
+HANDLERS = (
     SetAppViewHandler(),
     SaveViewHandler(),
-]
+)
@@ -27,7 +27,7 @@ class LoadSavedViewHandler(NodeHandler):
 
 
 # All handlers in this module, for auto-registration
-HANDLERS = [
+HANDLERS = (
     LoadDatasetHandler(),
     LoadSavedViewHandler(),
-]
+)
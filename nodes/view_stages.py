@@ -1,6 +1,10 @@
 """View-stage node handlers — filter, sort, and transform FiftyOne views."""
 
+import ast
+import json
 import logging
+from functools import lru_cache
+from types import MappingProxyType
 
 import fiftyone as fo
 from . import NodeHandler, PATCHES_FQNS, KEYPOINT_FQNS, DETECTION_FQNS, require_field_type
@@ -26,14 +30,101 @@ SAFE_NAMESPACE = {
     "abs": abs,
 }
 
+# Namespaces for eval, built once. Globals must be a real dict; the
+# locals are read-only so an expression can never alter SAFE_NAMESPACE.
+_SAFE_GLOBALS = {"__builtins__": MappingProxyType({})}
+_SAFE_LOCALS = MappingProxyType(SAFE_NAMESPACE)
+
+
+# Syntax accepted in expressions: literals, names from SAFE_NAMESPACE,
+# operators, calls, attribute access and indexing. Anything else (lambdas,
+# comprehensions, walrus, ...) is rejected before compiling.
+_ALLOWED_NODES = (
+    ast.Expression, ast.Constant, ast.Name, ast.Attribute, ast.Call,
+    ast.keyword, ast.Starred, ast.Subscript, ast.Slice, ast.List, ast.Tuple,
+    ast.Dict, ast.Set, ast.Compare, ast.BinOp, ast.BoolOp, ast.UnaryOp,
+    ast.IfExp, ast.cmpop, ast.operator, ast.boolop, ast.unaryop,
+    ast.expr_context,
+)
+
+
+def _check_expr(tree):
+    """Raise ValueError if the parsed expression uses disallowed syntax."""
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"{type(node).__name__} is not allowed")
+        if isinstance(node, ast.Attribute) and node.attr.startswith("_"):
+            raise ValueError(f"access to '{node.attr}' is not allowed")
+        if isinstance(node, ast.Name) and node.id not in SAFE_NAMESPACE:
+            raise ValueError(f"name '{node.id}' is not defined")
+
+
+@lru_cache(maxsize=512)
+def _compile_expr(expr_str: str):
+    """Parse, check and compile an expression once per string.
+
+    Repeated runs reuse the code object, and the syntax check replaces
+    relying on ``__builtins__={}`` alone to keep ``eval`` contained.
+    """
+    tree = ast.parse(expr_str, "<string>", mode="eval")
+    _check_expr(tree)
+    return compile(tree, "<string>", "eval")
+
+
+# Evaluated ViewExpressions by source string. Expressions are never
+# mutated once built, so the same object can back every run; other results
+# (e.g. dict literals for Map Labels) are mutable and always re-evaluated.
+_EXPR_OBJ_CACHE = {}
+_EXPR_OBJ_CACHE_SIZE = 256
+
 
 def safe_eval(expr_str: str):
     """Evaluate a FiftyOne ViewExpression string in a restricted namespace."""
+    expr = _EXPR_OBJ_CACHE.get(expr_str)
+    if expr is not None:
+        return expr
+
     try:
-        return eval(expr_str, {"__builtins__": {}}, SAFE_NAMESPACE)
+        result = eval(_compile_expr(expr_str), _SAFE_GLOBALS, _SAFE_LOCALS)
+    except SyntaxError as e:
+        where = f" at column {e.offset}" if e.offset else ""
+        raise ValueError(f"Invalid expression: {expr_str!r} — {e.msg}{where}")
     except Exception as e:
         raise ValueError(f"Invalid expression: {expr_str!r} — {e}")
 
+    if isinstance(result, fo.ViewExpression):
+        if len(_EXPR_OBJ_CACHE) >= _EXPR_OBJ_CACHE_SIZE:
+            _EXPR_OBJ_CACHE.clear()
+        _EXPR_OBJ_CACHE[expr_str] = result
+    return result
+
+
+@lru_cache(maxsize=256)
+def _split_csv(value: str):
+    """Split a comma-separated widget value into stripped, non-empty items.
+
+    Widget strings rarely change between runs, so the split is cached; a
+    tuple is returned so the cached value can't be mutated by callers.
+    """
+    return tuple(item for item in (v.strip() for v in value.split(",")) if item)
+
+
+@lru_cache(maxsize=64)
+def _parse_label_map(map_str: str):
+    """Parse a Map Labels mapping once per string; callers must not mutate it."""
+    try:
+        return json.loads(map_str)
+    except Exception:
+        # Fall back to safe_eval for Python dict literals
+        return safe_eval(map_str)
+
+
+def _optional_int(value):
+    """Convert an optional numeric widget value; None or "" means unset."""
+    if value is None or value == "":
+        return None
+    return int(value)
+
 
 # ---------------------------------------------------------------------------
 # Handler classes
@@ -88,7 +179,7 @@ class MatchTagsHandler(NodeHandler):
     def execute(self, input_view, params, ctx):
         tags = params.get("tags", "")
         if isinstance(tags, str):
-            tags = [t.strip() for t in tags.split(",") if t.strip()]
+            tags = list(_split_csv(tags))
         return input_view.match_tags(tags)
 
 
@@ -97,11 +188,7 @@ class TakeHandler(NodeHandler):
     category = "view_stage"
 
     def execute(self, input_view, params, ctx):
-        seed = params.get("seed")
-        if seed is not None and seed != "":
-            seed = int(seed)
-        else:
-            seed = None
+        seed = _optional_int(params.get("seed"))
         return input_view.take(int(params["count"]), seed=seed)
 
 
@@ -110,11 +197,7 @@ class ShuffleHandler(NodeHandler):
     category = "view_stage"
 
     def execute(self, input_view, params, ctx):
-        seed = params.get("seed")
-        if seed is not None and seed != "":
-            seed = int(seed)
-        else:
-            seed = None
+        seed = _optional_int(params.get("seed"))
         return input_view.shuffle(seed=seed)
 
 
@@ -158,11 +241,7 @@ class SortBySimilarityHandler(NodeHandler):
                 )
         except Exception:
             pass  # let FiftyOne raise its own error if list_brain_runs fails
-        k = params.get("k")
-        if k is not None and k != "" and k != 0:
-            k = int(k)
-        else:
-            k = None
+        k = _optional_int(params.get("k")) or None
         reverse = params.get("reverse", False)
         return input_view.sort_by_similarity(
             query,
@@ -197,25 +276,19 @@ class MapLabelsHandler(NodeHandler):
     category = "view_stage"
 
     def execute(self, input_view, params, ctx):
-        import json
-
         field = params.get("field", "")
         if not field:
             raise ValueError("No label field specified for Map Labels")
 
-        map_str = params.get("map", "{}")
-        try:
-            label_map = json.loads(map_str)
-        except Exception:
-            # Fall back to safe_eval for Python dict literals
-            label_map = safe_eval(map_str)
+        label_map = _parse_label_map(params.get("map", "{}"))
 
         if not isinstance(label_map, dict):
             raise ValueError(
                 f"Map must be a dict, got {type(label_map).__name__}"
             )
 
-        return input_view.map_labels(field, label_map)
+        # Copy so the view stage never shares the cached dict
+        return input_view.map_labels(field, dict(label_map))
 
 
 class ExistsHandler(NodeHandler):
@@ -238,8 +311,7 @@ class SelectFieldsHandler(NodeHandler):
         fields_str = params.get("fields", "")
         if not fields_str:
             return input_view.select_fields()
-        fields = [f.strip() for f in fields_str.split(",") if f.strip()]
-        return input_view.select_fields(fields)
+        return input_view.select_fields(list(_split_csv(fields_str)))
 
 
 class ExcludeFieldsHandler(NodeHandler):
@@ -250,8 +322,7 @@ class ExcludeFieldsHandler(NodeHandler):
         fields_str = params.get("fields", "")
         if not fields_str:
             raise ValueError("No fields specified for Exclude Fields")
-        fields = [f.strip() for f in fields_str.split(",") if f.strip()]
-        return input_view.exclude_fields(fields)
+        return input_view.exclude_fields(list(_split_csv(fields_str)))
 
 
 class SkipHandler(NodeHandler):
@@ -305,12 +376,12 @@ class SelectLabelsHandler(NodeHandler):
         tags = params.get("tags", "")
         if tags:
             if isinstance(tags, str):
-                tags = [t.strip() for t in tags.split(",") if t.strip()]
+                tags = list(_split_csv(tags))
             kwargs["tags"] = tags
         fields = params.get("fields", "")
         if fields:
             if isinstance(fields, str):
-                fields = [f.strip() for f in fields.split(",") if f.strip()]
+                fields = list(_split_csv(fields))
             kwargs["fields"] = fields
         if not kwargs:
             raise ValueError(
@@ -328,12 +399,12 @@ class ExcludeLabelsHandler(NodeHandler):
         tags = params.get("tags", "")
         if tags:
             if isinstance(tags, str):
-                tags = [t.strip() for t in tags.split(",") if t.strip()]
+                tags = list(_split_csv(tags))
             kwargs["tags"] = tags
         fields = params.get("fields", "")
         if fields:
             if isinstance(fields, str):
-                fields = [f.strip() for f in fields.split(",") if f.strip()]
+                fields = list(_split_csv(fields))
             kwargs["fields"] = fields
         if not kwargs:
             raise ValueError(
@@ -401,9 +472,9 @@ class ComputeBBoxAreaHandler(NodeHandler):
     """
 
     # Only Detections have bounding boxes with meaningful area
-    _BBOX_FQNS = {
+    _BBOX_FQNS = frozenset({
         "fiftyone.core.labels.Detections",
-    }
+    })
 
     node_type = "FiftyComfy/View Stages/Compute BBox Area"
     category = "view_stage"
@@ -462,7 +533,7 @@ class ComputeBBoxAreaHandler(NodeHandler):
 
 
 # All handlers in this module
-HANDLERS = [
+HANDLERS = (
     MatchHandler(),
     FilterLabelsHandler(),
     MatchLabelsHandler(),
@@ -486,4 +557,4 @@ HANDLERS = [
     GroupByHandler(),
     ComputeMetadataHandler(),
     ComputeBBoxAreaHandler(),
-]
+)
@@ -1,5 +1,7 @@
 """FiftyComfy Panel — Python panel that renders the JS LiteGraph canvas."""
 
+from functools import lru_cache
+
 import fiftyone.operators as foo
 import fiftyone.operators.types as types
 
@@ -21,8 +23,14 @@ class FiftyComfyPanel(foo.Panel):
 
     def render(self, ctx):
         """Render the panel using the JS FiftyComfyView component."""
-        panel = types.Object()
-        return types.Property(
-            panel,
-            view=types.View(component="FiftyComfyView"),
-        )
+        return _render_property()
+
+
+@lru_cache(maxsize=None)
+def _render_property():
+    """Build the (static) panel layout once; it doesn't depend on ctx."""
+    panel = types.Object()
+    return types.Property(
+        panel,
+        view=types.View(component="FiftyComfyView"),
+    )
@@ -105,7 +105,7 @@ const savePanelCss: React.CSSProperties = {
 interface SavedEntry {
   id: string;
   name: string;
-  saved_at: number;
+  saved_at: number; // ns since epoch (seconds for older saves)
 }
 
 // ─── Fetch dataset info ─────────────────────────────────────────────
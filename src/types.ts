@@ -70,7 +70,7 @@ export interface DatasetInfo {
 export interface SavedGraphEntry {
   id: string;
   name: string;
-  saved_at: number;
+  saved_at: number; // ns since epoch (seconds for older saves)
 }
 
 /** Full saved graph with data. */
@@ -78,5 +78,5 @@ export interface SavedGraphData {
   id: string;
   name: string;
   graph: SerializedGraph;
-  saved_at: number;
+  saved_at: number; // ns since epoch (seconds for older saves)
 }